@@ -0,0 +1,99 @@
+"""Regenerate the lazy imports mapping and `__all__` of the public API.
+
+The type-checking imports of `src/griffe/__init__.py` are the source of truth:
+this script parses them and rewrites the `_LAZY` and `__all__` literals accordingly.
+Comments attached to entries (YORE comments for example) are preserved.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+from pathlib import Path
+
+INIT = Path(__file__).parent.parent / "src" / "griffe" / "__init__.py"
+
+
+def _public_imports(tree: ast.Module) -> list[tuple[str, str]]:
+    type_checking = next(
+        (node for node in tree.body if isinstance(node, ast.If) and ast.unparse(node.test) == "_typing.TYPE_CHECKING"),
+        None,
+    )
+    if type_checking is None:
+        raise ValueError(f"Could not find the `if _typing.TYPE_CHECKING:` block in {INIT}")
+    imports = [
+        (alias.name, node.module)
+        for node in type_checking.body
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.startswith("_griffe")
+        for alias in node.names
+    ]
+    if not imports:
+        raise ValueError(f"Could not find any `_griffe` import in the `if _typing.TYPE_CHECKING:` block of {INIT}")
+    return imports
+
+
+def _sort_key(name: str) -> tuple[int, str]:
+    # Same order as Ruff's isort-style sorting of `__all__` (RUF022):
+    # constants first, then classes, then everything else.
+    if name.isupper():
+        return 0, name
+    if name[0].isupper():
+        return 1, name
+    return 2, name
+
+
+def _entry_comments(block: str) -> dict[str, list[str]]:
+    comments: dict[str, list[str]] = {}
+    pending: list[str] = []
+    for line in block.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            pending.append(stripped)
+        elif match := re.match(r'"(\w+)"', stripped):
+            if pending:
+                comments[match.group(1)] = pending
+            pending = []
+    return comments
+
+
+def _render(start: str, end: str, entries: list[tuple[str, str]], comments: dict[str, list[str]]) -> str:
+    lines = [start]
+    for name, entry in entries:
+        lines.extend(f"    {comment}" for comment in comments.get(name, ()))
+        lines.append(f"    {entry},")
+    lines.append(end)
+    return "\n".join(lines)
+
+
+def _find_block(code: str, pattern: str, description: str) -> re.Match[str]:
+    match = re.search(pattern, code, flags=re.MULTILINE | re.DOTALL)
+    if match is None:
+        raise ValueError(f"Could not find the `{description}` block in {INIT}")
+    return match
+
+
+def _replace(code: str, block: re.Match[str], render: str) -> str:
+    return code[: block.start()] + render + code[block.end() :]
+
+
+def main() -> None:
+    """Rewrite `src/griffe/__init__.py` in place."""
+    code = INIT.read_text()
+    imports = _public_imports(ast.parse(code))
+
+    lazy_block = _find_block(code, r"^_LAZY = \{\n.*?^\}", "_LAZY = {...}")
+    lazy_entries = [(name, f'"{name}": "{module}"') for name, module in imports]
+    lazy = _render("_LAZY = {", "}", lazy_entries, _entry_comments(lazy_block.group(0)))
+    code = _replace(code, lazy_block, lazy)
+
+    all_block = _find_block(code, r"^__all__ = \(\n.*?^\)", "__all__ = (...)")
+    all_entries = [(name, f'"{name}"') for name, _ in sorted(imports, key=lambda item: _sort_key(item[0]))]
+    all_ = _render("__all__ = (", ")", all_entries, _entry_comments(all_block.group(0)))
+    code = _replace(code, all_block, all_)
+
+    INIT.write_text(code)
+    print(f"Regenerated {len(imports)} public names in {INIT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -240,9 +240,22 @@ class Visitor:
         self.extensions.call("on_instance", node=node, obj=module, agent=self)
         self.extensions.call("on_module_instance", node=node, mod=module, agent=self)
         self.generic_visit(node)
+        self._set_lazy_exports_runtime(module)
         self.extensions.call("on_members", node=node, obj=module, agent=self)
         self.extensions.call("on_module_members", node=node, mod=module, agent=self)
 
+    def _set_lazy_exports_runtime(self, module: Module) -> None:
+        # Modules defining `__getattr__` (PEP 562) can import their public objects lazily,
+        # declaring them under an `if TYPE_CHECKING` condition for static analysis tools.
+        # Objects listed in `__all__` are still available at runtime, through `__getattr__`.
+        # `__getattr__` itself can be hidden from type-checkers (in the `else` branch
+        # of an `if TYPE_CHECKING` condition for example), so we don't check its `runtime` attribute.
+        if "__getattr__" not in module.members or not module.exports:
+            return
+        for name in module.exports:
+            if isinstance(name, str) and name in module.members:
+                module.members[name].runtime = True
+
     def visit_classdef(self, node: ast.ClassDef) -> None:
         """Visit a class definition node.
 
@@ -653,7 +666,9 @@ class Visitor:
         """
         if isinstance(node.parent, (ast.Module, ast.ClassDef)):  # type: ignore[attr-defined]
             condition = safe_get_condition(node.test, parent=self.current, log_level=None)
-            if str(condition) in {"typing.TYPE_CHECKING", "TYPE_CHECKING"}:
+            if str(condition) in {"typing.TYPE_CHECKING", "TYPE_CHECKING"} or (
+                isinstance(condition, Expr) and condition.canonical_path == "typing.TYPE_CHECKING"
+            ):
                 self.type_guarded = True
         self.generic_visit(node)
         self.type_guarded = False
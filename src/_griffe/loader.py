@@ -21,7 +21,6 @@ from _griffe.exceptions import (
 from _griffe.expressions import ExprName
 from _griffe.extensions.base import Extensions, load_extensions
 from _griffe.finder import ModuleFinder, NamespacePackage, Package
-from _griffe.git import tmp_worktree
 from _griffe.importer import dynamic_import
 from _griffe.logger import logger
 from _griffe.merger import merge_stubs
@@ -882,6 +881,9 @@ def load_git(
     Returns:
         A Griffe object.
     """
+    # Git utilities spawn subprocesses: only import them when actually loading from Git.
+    from _griffe.git import tmp_worktree
+
     with tmp_worktree(repo, ref) as worktree:
         search_paths = [worktree / path for path in search_paths or ["."]]
         if isinstance(objspec, Path):
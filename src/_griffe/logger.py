@@ -59,6 +59,8 @@ logger: Logger = Logger._get()
 """Our global logger, used throughout the library.
 
 Griffe's output and error messages are logging messages.
+It is created once, when `_griffe.logger` is first imported, and wraps the logger returned
+by the current logger factory (by default `logging.getLogger("griffe")`).
 
 Griffe provides the [`patch_loggers`][griffe.patch_loggers]
 function so dependent libraries can patch Griffe loggers as they see fit.
@@ -91,7 +93,10 @@ patch_loggers(get_logger)
 
 
 def get_logger(name: str = "griffe") -> Logger:
-    """Create and return a new logger instance.
+    """Return the logger instance for the given name, creating it on first call.
+
+    Subsequent calls with the same name return the same instance.
+    `get_logger()` without arguments returns our global [`logger`][griffe.logger].
 
     Parameters:
         name: The logger name.
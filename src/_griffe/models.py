@@ -425,7 +425,8 @@ class Object(ObjectAliasMixin):
         """Whether this object is available at runtime.
 
         Typically, type-guarded objects (under an `if TYPE_CHECKING` condition)
-        are not available at runtime.
+        are not available at runtime, unless they are listed in `__all__`
+        of a module defining `__getattr__` to import them lazily (PEP 562).
         """
 
         self.extra: dict[str, dict[str, Any]] = defaultdict(dict)
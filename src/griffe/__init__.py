@@ -1,6 +1,6 @@
-# This top-level module imports all public names from the package,
-# and exposes them as public objects. We have tests to make sure
-# no object is forgotten in this list.
+# This top-level module exposes all public names from the package as public objects.
+# Names are imported lazily from the internal `_griffe` package, on first access.
+# We have tests to make sure no object is forgotten in these lists.
 
 """Griffe package.
 
@@ -10,6 +10,10 @@ to generate API documentation or find breaking changes in your API.
 
 The entirety of the public API is exposed here, in the top-level `griffe` module.
 
+Public objects are imported lazily, the first time they are accessed.
+To import all of them eagerly when `griffe` itself is imported,
+set the `GRIFFE_LAZY_IMPORTS` environment variable to `0`.
+
 All messages written to standard output or error are logged using the `logging` module.
 Our logger's name is set to `"griffe"` and is public (you can rely on it).
 You can obtain the logger from the standard `logging` module: `logging.getLogger("griffe")`.
@@ -146,7 +150,7 @@ If you want to log messages from extensions, get a logger with `get_logger`.
 The `logger` attribute is used by Griffe itself. You can use it to temporarily disable Griffe logging.
 
 - [`griffe.logger`][]: Our global logger, used throughout the library.
-- [`griffe.get_logger`][]: Create and return a new logger instance.
+- [`griffe.get_logger`][]: Return the logger instance for the given name, creating it on first call.
 
 # Helpers
 
@@ -160,213 +164,455 @@ To test your Griffe extensions, or to load API data from code in memory, Griffe
 - [`griffe.temporary_inspected_package`][]: Create and inspect a temporary package.
 """
 
-from __future__ import annotations
-
-from _griffe.agents.inspector import Inspector, inspect
-from _griffe.agents.nodes.assignments import get_instance_names, get_name, get_names
-from _griffe.agents.nodes.ast import (
-    ast_children,
-    ast_first_child,
-    ast_kind,
-    ast_last_child,
-    ast_next,
-    ast_next_siblings,
-    ast_previous,
-    ast_previous_siblings,
-    ast_siblings,
-)
-from _griffe.agents.nodes.docstrings import get_docstring
-
-# YORE: Bump 2: Replace `ExportedName, ` with `` within line.
-from _griffe.agents.nodes.exports import ExportedName, get__all__, safe_get__all__
-from _griffe.agents.nodes.imports import relative_to_absolute
-from _griffe.agents.nodes.parameters import ParametersType, get_parameters
-from _griffe.agents.nodes.runtime import ObjectNode
-from _griffe.agents.nodes.values import get_value, safe_get_value
-from _griffe.agents.visitor import Visitor, builtin_decorators, stdlib_decorators, typing_overload, visit
-from _griffe.c3linear import c3linear_merge
-from _griffe.cli import DEFAULT_LOG_LEVEL, check, dump, get_parser, main
-from _griffe.collections import LinesCollection, ModulesCollection
-from _griffe.diff import (
-    AttributeChangedTypeBreakage,
-    AttributeChangedValueBreakage,
-    Breakage,
-    ClassRemovedBaseBreakage,
-    ObjectChangedKindBreakage,
-    ObjectRemovedBreakage,
-    ParameterAddedRequiredBreakage,
-    ParameterChangedDefaultBreakage,
-    ParameterChangedKindBreakage,
-    ParameterChangedRequiredBreakage,
-    ParameterMovedBreakage,
-    ParameterRemovedBreakage,
-    ReturnChangedTypeBreakage,
-    find_breaking_changes,
-)
-from _griffe.docstrings.google import parse_google
-from _griffe.docstrings.models import (
-    DocstringAdmonition,
-    DocstringAttribute,
-    DocstringClass,
-    DocstringDeprecated,
-    DocstringElement,
-    DocstringFunction,
-    DocstringModule,
-    DocstringNamedElement,
-    DocstringParameter,
-    DocstringRaise,
-    DocstringReceive,
-    DocstringReturn,
-    DocstringSection,
-    DocstringSectionAdmonition,
-    DocstringSectionAttributes,
-    DocstringSectionClasses,
-    DocstringSectionDeprecated,
-    DocstringSectionExamples,
-    DocstringSectionFunctions,
-    DocstringSectionModules,
-    DocstringSectionOtherParameters,
-    DocstringSectionParameters,
-    DocstringSectionRaises,
-    DocstringSectionReceives,
-    DocstringSectionReturns,
-    DocstringSectionText,
-    DocstringSectionWarns,
-    DocstringSectionYields,
-    DocstringWarn,
-    DocstringYield,
-)
-from _griffe.docstrings.numpy import parse_numpy
-from _griffe.docstrings.parsers import (
-    DocstringDetectionMethod,
-    DocstringStyle,
-    infer_docstring_style,
-    parse,
-    parse_auto,
-    parsers,
-)
-from _griffe.docstrings.sphinx import parse_sphinx
-from _griffe.docstrings.utils import docstring_warning, parse_docstring_annotation
-from _griffe.encoders import JSONEncoder, json_decoder
-from _griffe.enumerations import (
-    BreakageKind,
-    DocstringSectionKind,
-    ExplanationStyle,
-    Kind,
-    LogLevel,
-    ObjectKind,
-    ParameterKind,
-    Parser,
-)
-from _griffe.exceptions import (
-    AliasResolutionError,
-    BuiltinModuleError,
-    CyclicAliasError,
-    ExtensionError,
-    ExtensionNotLoadedError,
-    GitError,
-    GriffeError,
-    LastNodeError,
-    LoadingError,
-    NameResolutionError,
-    RootNodeError,
-    UnhandledEditableModuleError,
-    UnimportableModuleError,
-)
-from _griffe.expressions import (
-    Expr,
-    ExprAttribute,
-    ExprBinOp,
-    ExprBoolOp,
-    ExprCall,
-    ExprCompare,
-    ExprComprehension,
-    ExprConstant,
-    ExprDict,
-    ExprDictComp,
-    ExprExtSlice,
-    ExprFormatted,
-    ExprGeneratorExp,
-    ExprIfExp,
-    ExprJoinedStr,
-    ExprKeyword,
-    ExprLambda,
-    ExprList,
-    ExprListComp,
-    ExprName,
-    ExprNamedExpr,
-    ExprParameter,
-    ExprSet,
-    ExprSetComp,
-    ExprSlice,
-    ExprSubscript,
-    ExprTuple,
-    ExprUnaryOp,
-    ExprVarKeyword,
-    ExprVarPositional,
-    ExprYield,
-    ExprYieldFrom,
-    get_annotation,
-    get_base_class,
-    get_condition,
-    get_expression,
-    safe_get_annotation,
-    safe_get_base_class,
-    safe_get_condition,
-    safe_get_expression,
-)
-from _griffe.extensions.base import (
-    Extension,
-    Extensions,
-    LoadableExtensionType,
-    builtin_extensions,
-    load_extensions,
-)
-from _griffe.extensions.dataclasses import DataclassesExtension
-from _griffe.finder import ModuleFinder, NamePartsAndPathType, NamePartsType, NamespacePackage, Package
-from _griffe.git import assert_git_repo, get_latest_tag, get_repo_root, tmp_worktree
-from _griffe.importer import dynamic_import, sys_path
-from _griffe.loader import GriffeLoader, load, load_git, load_pypi
-from _griffe.logger import Logger, get_logger, logger, patch_loggers
-from _griffe.merger import merge_stubs
-from _griffe.mixins import (
-    DelMembersMixin,
-    GetMembersMixin,
-    ObjectAliasMixin,
-    SerializationMixin,
-    SetMembersMixin,
-)
-from _griffe.models import (
-    Alias,
-    Attribute,
-    Class,
-    Decorator,
-    Docstring,
-    Function,
-    Module,
-    Object,
-    Parameter,
-    Parameters,
-)
-from _griffe.stats import Stats
-from _griffe.tests import (
-    TmpPackage,
-    htree,
-    module_vtree,
-    temporary_inspected_module,
-    temporary_inspected_package,
-    temporary_pyfile,
-    temporary_pypackage,
-    temporary_visited_module,
-    temporary_visited_package,
-    vtree,
-)
-
-# Regenerate this list with the following Python snippet:
-# import griffe
-# names = sorted(n for n in dir(griffe) if not n.startswith("_") and n not in ("annotations", "lazy_importing"))
-# print('__all__ = [\n    "' + '",\n    "'.join(names) + '",\n]')
-__all__ = [
+import os as _os
+import typing as _typing
+from importlib import import_module as _import_module
+
+# Public objects are imported lazily, on first access, see `__getattr__` below.
+# These imports are only there for type-checkers and static analysis tools (including Griffe itself).
+if _typing.TYPE_CHECKING:
+    from _griffe.agents.inspector import Inspector, inspect
+    from _griffe.agents.nodes.assignments import get_instance_names, get_name, get_names
+    from _griffe.agents.nodes.ast import (
+        ast_children,
+        ast_first_child,
+        ast_kind,
+        ast_last_child,
+        ast_next,
+        ast_next_siblings,
+        ast_previous,
+        ast_previous_siblings,
+        ast_siblings,
+    )
+    from _griffe.agents.nodes.docstrings import get_docstring
+
+    # YORE: Bump 2: Replace `ExportedName, ` with `` within line.
+    from _griffe.agents.nodes.exports import ExportedName, get__all__, safe_get__all__
+    from _griffe.agents.nodes.imports import relative_to_absolute
+    from _griffe.agents.nodes.parameters import ParametersType, get_parameters
+    from _griffe.agents.nodes.runtime import ObjectNode
+    from _griffe.agents.nodes.values import get_value, safe_get_value
+    from _griffe.agents.visitor import Visitor, builtin_decorators, stdlib_decorators, typing_overload, visit
+    from _griffe.c3linear import c3linear_merge
+    from _griffe.cli import DEFAULT_LOG_LEVEL, check, dump, get_parser, main
+    from _griffe.collections import LinesCollection, ModulesCollection
+    from _griffe.diff import (
+        AttributeChangedTypeBreakage,
+        AttributeChangedValueBreakage,
+        Breakage,
+        ClassRemovedBaseBreakage,
+        ObjectChangedKindBreakage,
+        ObjectRemovedBreakage,
+        ParameterAddedRequiredBreakage,
+        ParameterChangedDefaultBreakage,
+        ParameterChangedKindBreakage,
+        ParameterChangedRequiredBreakage,
+        ParameterMovedBreakage,
+        ParameterRemovedBreakage,
+        ReturnChangedTypeBreakage,
+        find_breaking_changes,
+    )
+    from _griffe.docstrings.google import parse_google
+    from _griffe.docstrings.models import (
+        DocstringAdmonition,
+        DocstringAttribute,
+        DocstringClass,
+        DocstringDeprecated,
+        DocstringElement,
+        DocstringFunction,
+        DocstringModule,
+        DocstringNamedElement,
+        DocstringParameter,
+        DocstringRaise,
+        DocstringReceive,
+        DocstringReturn,
+        DocstringSection,
+        DocstringSectionAdmonition,
+        DocstringSectionAttributes,
+        DocstringSectionClasses,
+        DocstringSectionDeprecated,
+        DocstringSectionExamples,
+        DocstringSectionFunctions,
+        DocstringSectionModules,
+        DocstringSectionOtherParameters,
+        DocstringSectionParameters,
+        DocstringSectionRaises,
+        DocstringSectionReceives,
+        DocstringSectionReturns,
+        DocstringSectionText,
+        DocstringSectionWarns,
+        DocstringSectionYields,
+        DocstringWarn,
+        DocstringYield,
+    )
+    from _griffe.docstrings.numpy import parse_numpy
+    from _griffe.docstrings.parsers import (
+        DocstringDetectionMethod,
+        DocstringStyle,
+        infer_docstring_style,
+        parse,
+        parse_auto,
+        parsers,
+    )
+    from _griffe.docstrings.sphinx import parse_sphinx
+    from _griffe.docstrings.utils import docstring_warning, parse_docstring_annotation
+    from _griffe.encoders import JSONEncoder, json_decoder
+    from _griffe.enumerations import (
+        BreakageKind,
+        DocstringSectionKind,
+        ExplanationStyle,
+        Kind,
+        LogLevel,
+        ObjectKind,
+        ParameterKind,
+        Parser,
+    )
+    from _griffe.exceptions import (
+        AliasResolutionError,
+        BuiltinModuleError,
+        CyclicAliasError,
+        ExtensionError,
+        ExtensionNotLoadedError,
+        GitError,
+        GriffeError,
+        LastNodeError,
+        LoadingError,
+        NameResolutionError,
+        RootNodeError,
+        UnhandledEditableModuleError,
+        UnimportableModuleError,
+    )
+    from _griffe.expressions import (
+        Expr,
+        ExprAttribute,
+        ExprBinOp,
+        ExprBoolOp,
+        ExprCall,
+        ExprCompare,
+        ExprComprehension,
+        ExprConstant,
+        ExprDict,
+        ExprDictComp,
+        ExprExtSlice,
+        ExprFormatted,
+        ExprGeneratorExp,
+        ExprIfExp,
+        ExprJoinedStr,
+        ExprKeyword,
+        ExprLambda,
+        ExprList,
+        ExprListComp,
+        ExprName,
+        ExprNamedExpr,
+        ExprParameter,
+        ExprSet,
+        ExprSetComp,
+        ExprSlice,
+        ExprSubscript,
+        ExprTuple,
+        ExprUnaryOp,
+        ExprVarKeyword,
+        ExprVarPositional,
+        ExprYield,
+        ExprYieldFrom,
+        get_annotation,
+        get_base_class,
+        get_condition,
+        get_expression,
+        safe_get_annotation,
+        safe_get_base_class,
+        safe_get_condition,
+        safe_get_expression,
+    )
+    from _griffe.extensions.base import (
+        Extension,
+        Extensions,
+        LoadableExtensionType,
+        builtin_extensions,
+        load_extensions,
+    )
+    from _griffe.extensions.dataclasses import DataclassesExtension
+    from _griffe.finder import ModuleFinder, NamePartsAndPathType, NamePartsType, NamespacePackage, Package
+    from _griffe.git import assert_git_repo, get_latest_tag, get_repo_root, tmp_worktree
+    from _griffe.importer import dynamic_import, sys_path
+    from _griffe.loader import GriffeLoader, load, load_git, load_pypi
+    from _griffe.logger import Logger, get_logger, logger, patch_loggers
+    from _griffe.merger import merge_stubs
+    from _griffe.mixins import (
+        DelMembersMixin,
+        GetMembersMixin,
+        ObjectAliasMixin,
+        SerializationMixin,
+        SetMembersMixin,
+    )
+    from _griffe.models import (
+        Alias,
+        Attribute,
+        Class,
+        Decorator,
+        Docstring,
+        Function,
+        Module,
+        Object,
+        Parameter,
+        Parameters,
+    )
+    from _griffe.stats import Stats
+    from _griffe.tests import (
+        TmpPackage,
+        htree,
+        module_vtree,
+        temporary_inspected_module,
+        temporary_inspected_package,
+        temporary_pyfile,
+        temporary_pypackage,
+        temporary_visited_module,
+        temporary_visited_package,
+        vtree,
+    )
+
+# Map each public name to the internal module it is imported from.
+# Regenerate this mapping and `__all__` from the imports above with `python scripts/gen_exports.py`.
+_LAZY = {
+    "Inspector": "_griffe.agents.inspector",
+    "inspect": "_griffe.agents.inspector",
+    "get_instance_names": "_griffe.agents.nodes.assignments",
+    "get_name": "_griffe.agents.nodes.assignments",
+    "get_names": "_griffe.agents.nodes.assignments",
+    "ast_children": "_griffe.agents.nodes.ast",
+    "ast_first_child": "_griffe.agents.nodes.ast",
+    "ast_kind": "_griffe.agents.nodes.ast",
+    "ast_last_child": "_griffe.agents.nodes.ast",
+    "ast_next": "_griffe.agents.nodes.ast",
+    "ast_next_siblings": "_griffe.agents.nodes.ast",
+    "ast_previous": "_griffe.agents.nodes.ast",
+    "ast_previous_siblings": "_griffe.agents.nodes.ast",
+    "ast_siblings": "_griffe.agents.nodes.ast",
+    "get_docstring": "_griffe.agents.nodes.docstrings",
+    # YORE: Bump 2: Remove line.
+    "ExportedName": "_griffe.agents.nodes.exports",
+    "get__all__": "_griffe.agents.nodes.exports",
+    "safe_get__all__": "_griffe.agents.nodes.exports",
+    "relative_to_absolute": "_griffe.agents.nodes.imports",
+    "ParametersType": "_griffe.agents.nodes.parameters",
+    "get_parameters": "_griffe.agents.nodes.parameters",
+    "ObjectNode": "_griffe.agents.nodes.runtime",
+    "get_value": "_griffe.agents.nodes.values",
+    "safe_get_value": "_griffe.agents.nodes.values",
+    "Visitor": "_griffe.agents.visitor",
+    "builtin_decorators": "_griffe.agents.visitor",
+    "stdlib_decorators": "_griffe.agents.visitor",
+    "typing_overload": "_griffe.agents.visitor",
+    "visit": "_griffe.agents.visitor",
+    "c3linear_merge": "_griffe.c3linear",
+    "DEFAULT_LOG_LEVEL": "_griffe.cli",
+    "check": "_griffe.cli",
+    "dump": "_griffe.cli",
+    "get_parser": "_griffe.cli",
+    "main": "_griffe.cli",
+    "LinesCollection": "_griffe.collections",
+    "ModulesCollection": "_griffe.collections",
+    "AttributeChangedTypeBreakage": "_griffe.diff",
+    "AttributeChangedValueBreakage": "_griffe.diff",
+    "Breakage": "_griffe.diff",
+    "ClassRemovedBaseBreakage": "_griffe.diff",
+    "ObjectChangedKindBreakage": "_griffe.diff",
+    "ObjectRemovedBreakage": "_griffe.diff",
+    "ParameterAddedRequiredBreakage": "_griffe.diff",
+    "ParameterChangedDefaultBreakage": "_griffe.diff",
+    "ParameterChangedKindBreakage": "_griffe.diff",
+    "ParameterChangedRequiredBreakage": "_griffe.diff",
+    "ParameterMovedBreakage": "_griffe.diff",
+    "ParameterRemovedBreakage": "_griffe.diff",
+    "ReturnChangedTypeBreakage": "_griffe.diff",
+    "find_breaking_changes": "_griffe.diff",
+    "parse_google": "_griffe.docstrings.google",
+    "DocstringAdmonition": "_griffe.docstrings.models",
+    "DocstringAttribute": "_griffe.docstrings.models",
+    "DocstringClass": "_griffe.docstrings.models",
+    "DocstringDeprecated": "_griffe.docstrings.models",
+    "DocstringElement": "_griffe.docstrings.models",
+    "DocstringFunction": "_griffe.docstrings.models",
+    "DocstringModule": "_griffe.docstrings.models",
+    "DocstringNamedElement": "_griffe.docstrings.models",
+    "DocstringParameter": "_griffe.docstrings.models",
+    "DocstringRaise": "_griffe.docstrings.models",
+    "DocstringReceive": "_griffe.docstrings.models",
+    "DocstringReturn": "_griffe.docstrings.models",
+    "DocstringSection": "_griffe.docstrings.models",
+    "DocstringSectionAdmonition": "_griffe.docstrings.models",
+    "DocstringSectionAttributes": "_griffe.docstrings.models",
+    "DocstringSectionClasses": "_griffe.docstrings.models",
+    "DocstringSectionDeprecated": "_griffe.docstrings.models",
+    "DocstringSectionExamples": "_griffe.docstrings.models",
+    "DocstringSectionFunctions": "_griffe.docstrings.models",
+    "DocstringSectionModules": "_griffe.docstrings.models",
+    "DocstringSectionOtherParameters": "_griffe.docstrings.models",
+    "DocstringSectionParameters": "_griffe.docstrings.models",
+    "DocstringSectionRaises": "_griffe.docstrings.models",
+    "DocstringSectionReceives": "_griffe.docstrings.models",
+    "DocstringSectionReturns": "_griffe.docstrings.models",
+    "DocstringSectionText": "_griffe.docstrings.models",
+    "DocstringSectionWarns": "_griffe.docstrings.models",
+    "DocstringSectionYields": "_griffe.docstrings.models",
+    "DocstringWarn": "_griffe.docstrings.models",
+    "DocstringYield": "_griffe.docstrings.models",
+    "parse_numpy": "_griffe.docstrings.numpy",
+    "DocstringDetectionMethod": "_griffe.docstrings.parsers",
+    "DocstringStyle": "_griffe.docstrings.parsers",
+    "infer_docstring_style": "_griffe.docstrings.parsers",
+    "parse": "_griffe.docstrings.parsers",
+    "parse_auto": "_griffe.docstrings.parsers",
+    "parsers": "_griffe.docstrings.parsers",
+    "parse_sphinx": "_griffe.docstrings.sphinx",
+    "docstring_warning": "_griffe.docstrings.utils",
+    "parse_docstring_annotation": "_griffe.docstrings.utils",
+    "JSONEncoder": "_griffe.encoders",
+    "json_decoder": "_griffe.encoders",
+    "BreakageKind": "_griffe.enumerations",
+    "DocstringSectionKind": "_griffe.enumerations",
+    "ExplanationStyle": "_griffe.enumerations",
+    "Kind": "_griffe.enumerations",
+    "LogLevel": "_griffe.enumerations",
+    "ObjectKind": "_griffe.enumerations",
+    "ParameterKind": "_griffe.enumerations",
+    "Parser": "_griffe.enumerations",
+    "AliasResolutionError": "_griffe.exceptions",
+    "BuiltinModuleError": "_griffe.exceptions",
+    "CyclicAliasError": "_griffe.exceptions",
+    "ExtensionError": "_griffe.exceptions",
+    "ExtensionNotLoadedError": "_griffe.exceptions",
+    "GitError": "_griffe.exceptions",
+    "GriffeError": "_griffe.exceptions",
+    "LastNodeError": "_griffe.exceptions",
+    "LoadingError": "_griffe.exceptions",
+    "NameResolutionError": "_griffe.exceptions",
+    "RootNodeError": "_griffe.exceptions",
+    "UnhandledEditableModuleError": "_griffe.exceptions",
+    "UnimportableModuleError": "_griffe.exceptions",
+    "Expr": "_griffe.expressions",
+    "ExprAttribute": "_griffe.expressions",
+    "ExprBinOp": "_griffe.expressions",
+    "ExprBoolOp": "_griffe.expressions",
+    "ExprCall": "_griffe.expressions",
+    "ExprCompare": "_griffe.expressions",
+    "ExprComprehension": "_griffe.expressions",
+    "ExprConstant": "_griffe.expressions",
+    "ExprDict": "_griffe.expressions",
+    "ExprDictComp": "_griffe.expressions",
+    "ExprExtSlice": "_griffe.expressions",
+    "ExprFormatted": "_griffe.expressions",
+    "ExprGeneratorExp": "_griffe.expressions",
+    "ExprIfExp": "_griffe.expressions",
+    "ExprJoinedStr": "_griffe.expressions",
+    "ExprKeyword": "_griffe.expressions",
+    "ExprLambda": "_griffe.expressions",
+    "ExprList": "_griffe.expressions",
+    "ExprListComp": "_griffe.expressions",
+    "ExprName": "_griffe.expressions",
+    "ExprNamedExpr": "_griffe.expressions",
+    "ExprParameter": "_griffe.expressions",
+    "ExprSet": "_griffe.expressions",
+    "ExprSetComp": "_griffe.expressions",
+    "ExprSlice": "_griffe.expressions",
+    "ExprSubscript": "_griffe.expressions",
+    "ExprTuple": "_griffe.expressions",
+    "ExprUnaryOp": "_griffe.expressions",
+    "ExprVarKeyword": "_griffe.expressions",
+    "ExprVarPositional": "_griffe.expressions",
+    "ExprYield": "_griffe.expressions",
+    "ExprYieldFrom": "_griffe.expressions",
+    "get_annotation": "_griffe.expressions",
+    "get_base_class": "_griffe.expressions",
+    "get_condition": "_griffe.expressions",
+    "get_expression": "_griffe.expressions",
+    "safe_get_annotation": "_griffe.expressions",
+    "safe_get_base_class": "_griffe.expressions",
+    "safe_get_condition": "_griffe.expressions",
+    "safe_get_expression": "_griffe.expressions",
+    "Extension": "_griffe.extensions.base",
+    "Extensions": "_griffe.extensions.base",
+    "LoadableExtensionType": "_griffe.extensions.base",
+    "builtin_extensions": "_griffe.extensions.base",
+    "load_extensions": "_griffe.extensions.base",
+    "DataclassesExtension": "_griffe.extensions.dataclasses",
+    "ModuleFinder": "_griffe.finder",
+    "NamePartsAndPathType": "_griffe.finder",
+    "NamePartsType": "_griffe.finder",
+    "NamespacePackage": "_griffe.finder",
+    "Package": "_griffe.finder",
+    "assert_git_repo": "_griffe.git",
+    "get_latest_tag": "_griffe.git",
+    "get_repo_root": "_griffe.git",
+    "tmp_worktree": "_griffe.git",
+    "dynamic_import": "_griffe.importer",
+    "sys_path": "_griffe.importer",
+    "GriffeLoader": "_griffe.loader",
+    "load": "_griffe.loader",
+    "load_git": "_griffe.loader",
+    "load_pypi": "_griffe.loader",
+    "Logger": "_griffe.logger",
+    "get_logger": "_griffe.logger",
+    "logger": "_griffe.logger",
+    "patch_loggers": "_griffe.logger",
+    "merge_stubs": "_griffe.merger",
+    "DelMembersMixin": "_griffe.mixins",
+    "GetMembersMixin": "_griffe.mixins",
+    "ObjectAliasMixin": "_griffe.mixins",
+    "SerializationMixin": "_griffe.mixins",
+    "SetMembersMixin": "_griffe.mixins",
+    "Alias": "_griffe.models",
+    "Attribute": "_griffe.models",
+    "Class": "_griffe.models",
+    "Decorator": "_griffe.models",
+    "Docstring": "_griffe.models",
+    "Function": "_griffe.models",
+    "Module": "_griffe.models",
+    "Object": "_griffe.models",
+    "Parameter": "_griffe.models",
+    "Parameters": "_griffe.models",
+    "Stats": "_griffe.stats",
+    "TmpPackage": "_griffe.tests",
+    "htree": "_griffe.tests",
+    "module_vtree": "_griffe.tests",
+    "temporary_inspected_module": "_griffe.tests",
+    "temporary_inspected_package": "_griffe.tests",
+    "temporary_pyfile": "_griffe.tests",
+    "temporary_pypackage": "_griffe.tests",
+    "temporary_visited_module": "_griffe.tests",
+    "temporary_visited_package": "_griffe.tests",
+    "vtree": "_griffe.tests",
+}
+
+
+# Hidden from type-checkers, so that they still report unknown attributes of `griffe`.
+if not _typing.TYPE_CHECKING:
+
+    def __getattr__(name: str) -> _typing.Any:
+        module = _LAZY.get(name)
+        if module is None:
+            raise AttributeError(f"module 'griffe' has no attribute {name!r}")
+        value = getattr(_import_module(module), name)
+        globals()[name] = value
+        return value
+
+
+def __dir__() -> list[str]:
+    # Also list public objects that were not imported yet.
+    return sorted({*globals(), *__all__})
+
+
+def _import_all() -> None:
+    # Import each internal module only once, binding all its public names at once.
+    module_names: dict[str, list[str]] = {}
+    for name, module in _LAZY.items():
+        module_names.setdefault(module, []).append(name)
+    for module, names in module_names.items():
+        imported = _import_module(module)
+        globals().update({name: getattr(imported, name) for name in names})
+
+
+__all__ = (
     "DEFAULT_LOG_LEVEL",
     "Alias",
     "AliasResolutionError",
@@ -575,4 +821,9 @@ __all__ = [
     "typing_overload",
     "visit",
     "vtree",
-]
+)
+
+# Lazy imports can be disabled, for example to surface import errors early,
+# or for tools that expect all modules to be imported (freezers, profilers).
+if _os.getenv("GRIFFE_LAZY_IMPORTS", "1") == "0":
+    _import_all()
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from collections import defaultdict
 from fnmatch import fnmatch
 from pathlib import Path
@@ -11,6 +14,7 @@ import pytest
 from mkdocstrings.inventory import Inventory
 
 import griffe
+from _griffe.stats import Stats
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -118,6 +122,59 @@ def test_exposed_objects(modulelevel_internal_objects: list[griffe.Object | grif
     assert not not_exposed, "Objects not exposed:\n" + "\n".join(sorted(not_exposed))
 
 
+def test_lazy_imports_match_public_api(public_api: griffe.Module) -> None:
+    """All public names are lazily imported from the same modules as the type-checking imports."""
+    mismatches = [
+        name
+        for name in griffe.__all__
+        if public_api[name].target_path != f"{griffe._LAZY.get(name)}.{name}"
+    ]
+    assert not mismatches, "Lazy imports not matching public API:\n" + "\n".join(sorted(mismatches))
+
+
+def test_lazy_imports_visible_at_runtime(public_api: griffe.Module) -> None:
+    """Lazily imported public objects are seen as available at runtime by static analysis."""
+    assert all(public_api[name].runtime and public_api[name].is_wildcard_exposed for name in griffe.__all__)
+
+
+def test_lazy_imports_cover_all_names() -> None:
+    """The lazy imports mapping contains exactly the names listed in `__all__`."""
+    assert set(griffe._LAZY) == set(griffe.__all__)
+    assert len(griffe._LAZY) == len(griffe.__all__)
+
+
+def test_lazy_imports_are_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lazily imported objects are stored in the module namespace on first access."""
+    monkeypatch.delitem(vars(griffe), "Stats", raising=False)
+    assert griffe.Stats is Stats
+    assert vars(griffe)["Stats"] is Stats
+
+
+@pytest.mark.parametrize(("lazy_imports", "imported"), [("1", False), ("0", True)])
+def test_lazy_imports_can_be_disabled(lazy_imports: str, imported: bool) -> None:
+    """Setting `GRIFFE_LAZY_IMPORTS=0` imports all public objects when importing `griffe`."""
+    code = "import sys, griffe; print('_griffe.diff' in sys.modules)"
+    env = {**os.environ, "GRIFFE_LAZY_IMPORTS": lazy_imports}
+    process = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)  # noqa: S603
+    assert process.stdout.strip() == str(imported)
+
+
+def test_loading_does_not_import_test_helpers() -> None:
+    """Test helpers (and their dependencies) are only imported when used."""
+    code = "import sys, griffe; griffe.load('json'); print('_griffe.tests' in sys.modules)"
+    process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert process.stdout.strip() == "False"
+
+
+def test_lazy_imports_listed_in_dir() -> None:
+    """Public objects are listed by `dir()` even before being imported."""
+    names = dir(griffe)
+    assert set(griffe.__all__).issubset(names)
+    assert "__doc__" in names
+    assert len(names) == len(set(names))
+    assert {name for name in names if not name.startswith("_")} == set(griffe.__all__)
+
+
 def test_unique_names(modulelevel_internal_objects: list[griffe.Object | griffe.Alias]) -> None:
     """All internal objects have unique names."""
     names_to_paths = defaultdict(list)
@@ -40,6 +40,78 @@ def test_not_defined_at_runtime() -> None:
         assert "TYPE_C" not in package.members
 
 
+def test_aliased_typing_module_type_checking_condition() -> None:
+    """Assert that objects guarded by `TYPE_CHECKING` accessed through an aliased `typing` module are not defined at runtime."""
+    with temporary_visited_module(
+        """
+        import typing as _typing
+
+        if _typing.TYPE_CHECKING:
+            from package.module_a import A
+        """,
+    ) as module:
+        assert not module["A"].runtime
+
+
+def test_lazy_exports_defined_at_runtime() -> None:
+    """Assert that type-guarded objects listed in `__all__` of a module defining `__getattr__` are defined at runtime."""
+    with temporary_visited_module(
+        """
+        from typing import TYPE_CHECKING
+
+        if TYPE_CHECKING:
+            from package.module_a import A
+            from package.module_b import B
+
+        def __getattr__(name): ...
+
+        __all__ = ["A"]
+        """,
+    ) as module:
+        assert module["A"].runtime
+        assert module["A"].is_wildcard_exposed
+        assert not module["B"].runtime
+
+
+@pytest.mark.parametrize(
+    "getattr_code",
+    [
+        "if not TYPE_CHECKING:\n    def __getattr__(name): ...",
+        "if TYPE_CHECKING:\n    pass\nelse:\n    def __getattr__(name): ...",
+    ],
+)
+def test_lazy_exports_defined_at_runtime_with_hidden_getattr(getattr_code: str) -> None:
+    """Assert that lazy exports are defined at runtime when `__getattr__` is hidden from type-checkers."""
+    code = f"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from package.module_a import A
+
+{getattr_code}
+
+__all__ = ["A"]
+"""
+    with temporary_visited_module(code) as module:
+        assert module["A"].runtime
+        assert module["A"].is_wildcard_exposed
+
+
+def test_type_guarded_exports_not_defined_at_runtime_without_getattr() -> None:
+    """Assert that type-guarded objects listed in `__all__` are not defined at runtime without `__getattr__`."""
+    with temporary_visited_module(
+        """
+        from typing import TYPE_CHECKING
+
+        if TYPE_CHECKING:
+            from package.module_a import A
+
+        __all__ = ["A"]
+        """,
+    ) as module:
+        assert not module["A"].runtime
+
+
 @pytest.mark.parametrize(
     ("decorator", "labels"),
     [